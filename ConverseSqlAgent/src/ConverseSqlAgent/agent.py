@@ -17,6 +17,17 @@ from prompts import ( DEFAULT_SYSTEM_PROMPT,
 
 from utils import extract_xml_content
 
+# Built once at module level; the message is never mutated after being
+# appended, so the same dict can be reused across turns
+END_TURN_MESSAGE = {
+    "role": "user",
+    "content": [
+        {
+            "text": END_TURN_PROMPT
+        }
+    ]
+}
+
 
 class BaseAgent():
     
@@ -29,6 +40,8 @@ class BaseAgent():
         
         # Tooling
         self.tool_spec_list = []
+        self.tool_spec_map = {}
+        self.tool_config = {"tools": self.tool_spec_list}
         
         # System Prompt
         self.system_prompt_template = system_prompt_template
@@ -41,6 +54,7 @@ class BaseAgent():
         
         # Used for timing
         self.start_time = None
+        self.last_request_time = None
         self.requests_per_minute_limit=requests_per_minute_limit
         
 
@@ -72,20 +86,33 @@ class BaseAgent():
         
         print(f"User: {input_text}")
         print("Beginning execution loop")
-        
+
+        # Cache the formatted system prompt across loop iterations
+        system_prompt = None
+        system_prompt_plan = None
+
         # Begin main loop
-        
+
         while True:
             
             # Limit how fast the agent executes
+            # Only sleep for the part of the interval not already spent
+            # handling the previous response and tool calls
             if self.requests_per_minute_limit:
-                sleep(60/self.requests_per_minute_limit)
-            
-            
+                request_interval = 60/self.requests_per_minute_limit
+                if self.last_request_time:
+                    elapsed = (datetime.now()-self.last_request_time).total_seconds()
+                    if elapsed < request_interval:
+                        sleep(request_interval-elapsed)
+
+
             #Inject current execution plan into system prompt
-            system_prompt = self.system_prompt_template.format(
-                current_plan_prompt=CURRENT_PLAN_PROMPT_TEMPLATE.format(current_plan=self.system_current_plan)
-            )
+            # Only re-format when the plan has changed since the last iteration
+            if system_prompt is None or system_prompt_plan != self.system_current_plan:
+                system_prompt = self.system_prompt_template.format(
+                    current_plan_prompt=CURRENT_PLAN_PROMPT_TEMPLATE.format(current_plan=self.system_current_plan)
+                )
+                system_prompt_plan = self.system_current_plan
             
             #Invoke the Converse API
             
@@ -104,7 +131,8 @@ class BaseAgent():
                             "temperature": temperature
                         }
                     )
-                    
+
+                    self.last_request_time = datetime.now()
                     break
                 except ClientError as e:
                     error_code = e.response["Error"]["Code"]
@@ -144,14 +172,7 @@ class BaseAgent():
                 messages.append(tool_result_message)
             elif response["stopReason"] == "end_turn":
                 if len(messages[-1]['content']) == 0:
-                    messages.append({
-                        "role": "user",
-                        "content": [
-                            {
-                                "text": END_TURN_PROMPT
-                            }
-                        ]
-                    })
+                    messages.append(END_TURN_MESSAGE)
                 else:
                     final_response = extract_xml_content(messages[-1]['content'][0]['text'], "final_response")
                     if final_response:
@@ -162,14 +183,7 @@ class BaseAgent():
                         
                         return final_response
                     else:
-                        messages.append({
-                            "role": "user",
-                            "content": [
-                                {
-                                    "text": END_TURN_PROMPT
-                                }
-                            ]
-                        })
+                        messages.append(END_TURN_MESSAGE)
                 
                 
     def create_timestamp_content_block(self, start_time, current_time=None):
@@ -179,9 +193,9 @@ class BaseAgent():
             current_time = datetime.now()
         
         total_runtime = current_time-start_time
-        
+
         return {
-            "text": f"Current Datetime: {datetime.now()}\nTotal Runtime: {total_runtime}"
+            "text": f"Current Datetime: {current_time}\nTotal Runtime: {total_runtime}"
         }
         
     def add_tool(self, tool_spec, function):
@@ -202,6 +216,9 @@ class BaseAgent():
         if function_name:
             # Monkey patch the function to the class
             setattr(self.__class__, function_name, function)
+
+            # Index the tool spec by name for dispatch
+            self.tool_spec_map[function_name] = tool_spec
         else:
             raise ValueError("Tool specification must include a 'name' field")
         
@@ -233,9 +250,9 @@ class BaseAgent():
         return self.tool_spec_list
     
     def get_tool_config(self):
-        return {
-                "tools": self.tool_spec_list
-        }
+        # The config dict is built once and holds a reference to
+        # tool_spec_list, so added/deleted tools are reflected automatically
+        return self.tool_config
 
     def delete_tool(self, function_name):
         """
@@ -259,18 +276,11 @@ class BaseAgent():
             #        break
             #else:
             #    print(f"Warning: Tool specification for '{function_name}' not found in the tool_spec_list.")
-            # Remove the tool specification from the list
-            index = 0
-            found = False
-            while index < len(self.tool_spec_list):
-                tool_spec = self.tool_spec_list[index]
-                if tool_spec.get('toolSpec', {}).get('name') == function_name:
-                    del self.tool_spec_list[index]
-                    found = True
-                    break
-                index += 1
-    
-            if not found:
+            # Remove the tool specification from the list and the dispatch map
+            tool_spec = self.tool_spec_map.pop(function_name, None)
+            if tool_spec is not None:
+                self.tool_spec_list.remove(tool_spec)
+            else:
                 print(f"Warning: Tool specification for '{function_name}' not found in the tool_spec_list.")                
         else:
             raise ValueError("Function name must be provided")
@@ -304,20 +314,19 @@ class BaseAgent():
                 print(f"Tool Use: {tool_name}")
                 print(f"Parameters: {parameters}")
                 
-                # Default message
-                tool_result = f"Tool {tool_name} is not supported."
-                
-                # Call the appropriate tool
-                for tool_spec in self.tool_spec_list:
-                    if tool_name == tool_spec["toolSpec"]["name"]:
-                        # Retrieve the method
-                        tool = getattr(self, tool_name)
-                        
-                        # Call the method
-                        try:
-                            tool_result = tool(**parameters)
-                        except Exception as e:
-                            tool_result = f"Error occurred when calling {tool_name}: {e}"
+                # Call the appropriate tool via a dict lookup instead of
+                # scanning the tool spec list for every tool use
+                if tool_name in self.tool_spec_map:
+                    # Retrieve the method
+                    tool = getattr(self, tool_name)
+
+                    # Call the method
+                    try:
+                        tool_result = tool(**parameters)
+                    except Exception as e:
+                        tool_result = f"Error occurred when calling {tool_name}: {e}"
+                else:
+                    tool_result = f"Tool {tool_name} is not supported."
                 
                 #Print the result, limit character output
                 print(f"Tool Result: {str(tool_result)[:100]}")
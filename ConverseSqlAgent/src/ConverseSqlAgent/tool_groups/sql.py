@@ -2,16 +2,32 @@ import io
 import csv
 import json
 import boto3
+from functools import lru_cache
 from sqlalchemy import create_engine, text, inspect
 
 import boto3
 import json
 from botocore.exceptions import ClientError
 
+# Engine cache so repeated tool calls reuse the SQLAlchemy connection pool
+# instead of opening a brand-new database connection per call
+_engine_cache = {}
+
+def get_cached_engine(url):
+    engine = _engine_cache.get(url)
+    if engine is None:
+        engine = create_engine(url)
+        _engine_cache[url] = engine
+    return engine
+
+@lru_cache(maxsize=32)
 def retrieve_database_url(secrets_manager_key, database_name=None):
     """
     Returns a URL for SQLAlchemy based on AWS Secrets Manager credentials.
 
+    Results are memoized per (secrets_manager_key, database_name) so repeated
+    tool calls in the same session skip the Secrets Manager round-trip.
+
     Args:
         secrets_manager_key (str): The AWS Secrets Manager key for the connection details.
         database_name (str, optional): The name of the database to connect to. If specified,
@@ -94,7 +110,7 @@ def invoke_sql_query(self, secrets_manager_key, database_name, query):
     """
     try:
         url = retrieve_database_url(secrets_manager_key, database_name)
-        engine = create_engine(url)
+        engine = get_cached_engine(url)
         with engine.connect() as connection:
             result = connection.execute(text(query))
         
@@ -120,15 +136,14 @@ def get_database_schemas(self, secrets_manager_key, database_name):
     """
     try:
         url = retrieve_database_url(secrets_manager_key, database_name)
-        engine = create_engine(url)
+        engine = get_cached_engine(url)
         inspector = inspect(engine)
         schemas = inspector.get_schema_names()
         
         output = io.StringIO()
         writer = csv.writer(output)
         writer.writerow(["Schema"])
-        for schema in schemas:
-            writer.writerow([schema])
+        writer.writerows([schema] for schema in schemas)
         final_output = output.getvalue()
     except Exception as e:
         final_output = f"Getting database schemas encountered an error: {e}"
@@ -148,15 +163,14 @@ def get_schema_tables(self, secrets_manager_key, database_name, schema):
     """
     try:
         url = retrieve_database_url(secrets_manager_key, database_name)
-        engine = create_engine(url)
+        engine = get_cached_engine(url)
         inspector = inspect(engine)
         tables = inspector.get_table_names(schema=schema)
         
         output = io.StringIO()
         writer = csv.writer(output)
         writer.writerow(["Table"])
-        for table in tables:
-            writer.writerow([table])
+        writer.writerows([table] for table in tables)
         final_output = output.getvalue()
     except Exception as e:
         final_output = f"Getting schema tables encountered an error: {e}"
@@ -177,21 +191,20 @@ def get_table_columns(self, secrets_manager_key, database_name, schema, table):
     """
     try:
         url = retrieve_database_url(secrets_manager_key, database_name)
-        engine = create_engine(url)
+        engine = get_cached_engine(url)
         inspector = inspect(engine)
         columns = inspector.get_columns(table_name=table, schema=schema)
         
         output = io.StringIO()
         writer = csv.writer(output)
         writer.writerow(["Column Name", "Data Type", "Nullable", "Default", "Primary Key"])
-        for column in columns:
-            writer.writerow([
-                column['name'],
-                str(column['type']),
-                str(column.get('nullable', '')),
-                str(column.get('default', '')),
-                str(column.get('primary_key', False))
-            ])
+        writer.writerows([
+            column['name'],
+            str(column['type']),
+            str(column.get('nullable', '')),
+            str(column.get('default', '')),
+            str(column.get('primary_key', False))
+        ] for column in columns)
         final_output = output.getvalue()
     except Exception as e:
         final_output = f"Getting table columns encountered an error: {e}"
@@ -211,7 +224,7 @@ def get_foreign_keys(self, secrets_manager_key, database_name, schema=None):
     """
     try:
         url = retrieve_database_url(secrets_manager_key, database_name)
-        engine = create_engine(url)
+        engine = get_cached_engine(url)
         inspector = inspect(engine)
 
         output = io.StringIO()
@@ -226,15 +239,14 @@ def get_foreign_keys(self, secrets_manager_key, database_name, schema=None):
         for schema_name in schemas:
             for table_name in inspector.get_table_names(schema=schema_name):
                 fks = inspector.get_foreign_keys(table_name, schema=schema_name)
-                for fk in fks:
-                    writer.writerow([
-                        schema_name,
-                        table_name,
-                        fk['constrained_columns'][0],
-                        fk.get('referred_schema', schema_name),
-                        fk['referred_table'],
-                        fk['referred_columns'][0]
-                    ])
+                writer.writerows([
+                    schema_name,
+                    table_name,
+                    fk['constrained_columns'][0],
+                    fk.get('referred_schema', schema_name),
+                    fk['referred_table'],
+                    fk['referred_columns'][0]
+                ] for fk in fks)
 
         final_output = output.getvalue()
     except Exception as e:
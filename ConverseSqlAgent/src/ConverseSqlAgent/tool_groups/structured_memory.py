@@ -2,6 +2,19 @@ import json
 
 from prompts import STRUCTURED_MEMORY_TOOL_GROUP_INSTRUCTIONS_PROMPT
 
+# Use orjson for memory serialization when it is available, it is
+# significantly faster than the stdlib json module
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 def create_memory_index(self):
     """
     Creates a new memory index    
@@ -29,7 +42,7 @@ def create_memory_index(self):
     self.table.put_item(
         Item={
             "id": "1",
-            "contents": json.dumps(memory_index)
+            "contents": _json_dumps(memory_index)
         }
     )
     
@@ -51,7 +64,7 @@ def get_memory_index(self):
         contents = response["Item"].get("contents", None)
         
         if contents:
-            memory = json.loads(contents)
+            memory = _json_loads(contents)
         else:
             memory = None
         
@@ -60,9 +73,10 @@ def get_memory_index(self):
         
     return memory
 
-def update_memory_index_entry(self, memory_id, title, description, 
-                              is_delete_protected=False, is_write_protected=False):
-    
+def update_memory_index_entry(self, memory_id, title, description,
+                              is_delete_protected=False, is_write_protected=False,
+                              memory_index=None):
+
     # Index entry
     index_entry = {
         "memory_id": memory_id,
@@ -71,9 +85,9 @@ def update_memory_index_entry(self, memory_id, title, description,
         "title": title,
         "description": description
     }
-    
-    # Retrieve the memory index first
-    memory = self.get_memory_index()
+
+    # Retrieve the memory index first, unless the caller already fetched it
+    memory = memory_index if memory_index is not None else self.get_memory_index()
     
     if memory:
     
@@ -93,7 +107,7 @@ def update_memory_index_entry(self, memory_id, title, description,
         self.table.put_item(
             Item={
                 "id": "1",
-                "contents": json.dumps(memory)
+                "contents": _json_dumps(memory)
             }
         )
         
@@ -136,7 +150,7 @@ def delete_memory_index_entry(self, memory_id):
     self.table.put_item(
         Item={
             "id": "1",
-            "contents": json.dumps(memory)
+            "contents": _json_dumps(memory)
         }
     )
 
@@ -171,8 +185,11 @@ def write_memory(self, memory_id, title, description, contents, is_delete_protec
                         "body": f"Memory id {memory_id} is write protected. You cannot update this memory."
                     }
 
-        # Update the index
-        self.update_memory_index_entry(memory_id, title, description, is_delete_protected, is_write_protected)
+        # Update the index, reusing the index fetched above to avoid a
+        # second DynamoDB read
+        self.update_memory_index_entry(memory_id, title, description,
+                                       is_delete_protected, is_write_protected,
+                                       memory_index=memory_index)
 
         # Memory contents
         memory_contents = {
@@ -187,7 +204,7 @@ def write_memory(self, memory_id, title, description, contents, is_delete_protec
         self.table.put_item(
             Item={
                 "id": memory_id,
-                "contents": json.dumps(memory_contents)
+                "contents": _json_dumps(memory_contents)
             }
         )
 
@@ -212,7 +229,7 @@ def read_memory(self, memory_id):
     )
     
     if "Item" in response:
-        contents = json.loads(response["Item"].get("contents"))
+        contents = _json_loads(response["Item"].get("contents"))
         
         return {
             "statusCode": 200,
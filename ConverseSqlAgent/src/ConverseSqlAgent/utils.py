@@ -1,9 +1,13 @@
 import re
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _compile_tag_pattern(tag_name):
+    return re.compile(f'<{tag_name}>(.*?)</{tag_name}>', re.DOTALL)
 
 def extract_xml_content(text, tag_name):
-    pattern = f'<{tag_name}>(.*?)</{tag_name}>'
-    match = re.search(pattern, text, re.DOTALL)
+    match = _compile_tag_pattern(tag_name).search(text)
     if match:
         return match.group(1).strip()
     else:
-        return None
\ No newline at end of file
+        return None